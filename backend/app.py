@@ -1,15 +1,22 @@
+import time
+_process_start = time.perf_counter()
+
 import eventlet
 eventlet.monkey_patch()
+_patched_at = time.perf_counter()
 
 import os
 import uuid
 import json
-import subprocess
-import time
+from collections import deque
 from flask import Flask, request
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room as join_socket_room, leave_room as leave_socket_room
 from flask_cors import CORS
 from typing import Dict, List, Any, Optional
+from matchmaking import MatchmakingQueue
+from match_stats import MatchStats
+from runners import available_runners
+_imported_at = time.perf_counter()
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -23,9 +30,39 @@ socketio = SocketIO(
     async_mode='eventlet'
 )
 
+# Startup and sandbox instrumentation (milliseconds)
+metrics = {
+    'startup': {
+        'monkeyPatchMs': round((_patched_at - _process_start) * 1000, 1),
+        'importsMs': round((_imported_at - _patched_at) * 1000, 1),
+        'appInitMs': round((time.perf_counter() - _imported_at) * 1000, 1),
+        'firstConnectionMs': None
+    },
+    'sandbox': {},  # per language: spawns, totalMs, maxMs
+    'prescreen': {
+        'checked': 0,
+        'rejected': 0,
+        'reasons': {}
+    },
+    'spectators': {
+        'count': 0,
+        'framesSent': 0,
+        'lastFrameCpuMs': 0.0,
+        'cpuPerSpectatorUs': 0.0
+    }
+}
+
+# Execution backends by language, each with its own warm worker pool
+RUNNERS = available_runners()
+DEFAULT_LANGUAGE = 'python'
+
 # Socket ID to Player ID mapping
 socket_to_player: Dict[str, str] = {}
 
+# Index of players who are not eliminated (dict as an insertion-ordered set),
+# kept in step with game_state['players'] so reward effects skip the scan
+alive_players: Dict[str, None] = {}
+
 # In-memory game state
 game_state = {
     'players': {},
@@ -34,6 +71,34 @@ game_state = {
     'winner': None
 }
 
+# Live leaderboard aggregates for the current match, and summaries of
+# finished matches (most recent last)
+match_stats = MatchStats()
+match_history = deque(maxlen=int(os.getenv('MATCH_HISTORY_SIZE', 50)))
+
+# Public matchmaking: players queue by rating and are placed into the room
+# automatically once a group forms
+matchmaking_queue = MatchmakingQueue(
+    room_size=int(os.getenv('MATCH_ROOM_SIZE', 4)),
+    min_room_size=2,
+    max_wait=float(os.getenv('MATCH_MAX_WAIT', 30))
+)
+matchmaker_started = False
+MATCHMAKER_INTERVAL = 1.0  # seconds between matcher passes
+
+# Game events go to the players' Socket.IO room rather than to every
+# connected socket, so spectators never receive them
+PLAYER_ROOM = 'players'
+
+# Read-only spectators. They sit in a Socket.IO room of their own (never in
+# game_state['players']) and get one shared frame per tick, nothing else.
+SPECTATOR_ROOM = 'spectators'
+SPECTATOR_INTERVAL = float(os.getenv('SPECTATOR_INTERVAL', 1.0))  # seconds between frames
+spectator_sockets = set()
+spectator_feed_started = False
+last_spectator_frame: Optional[Dict[str, Any]] = None
+last_spectator_encoding: Optional[str] = None  # for skipping unchanged frames
+
 # Problem templates for card generation
 PROBLEM_TEMPLATES = [
     {
@@ -167,18 +232,24 @@ def generate_card() -> Dict[str, Any]:
     """Generate a random card from problem templates"""
     import random
     template = random.choice(PROBLEM_TEMPLATES).copy()
+    problem = template['problem'].copy()
+    problem['signatures'] = {
+        language: runner.signature(problem['functionSignature'])
+        for language, runner in RUNNERS.items()
+    }
     card = {
         'id': str(uuid.uuid4()),
-        'problem': template['problem'].copy(),
+        'problem': problem,
         'reward': template.get('reward'),
         'challenge': template.get('challenge')
     }
     return card
 
 
-def execute_code(code: str, function_signature: str, test_cases: List[Dict]) -> Dict[str, Any]:
+def execute_code(code: str, function_signature: str, test_cases: List[Dict],
+                 language: str = DEFAULT_LANGUAGE) -> Dict[str, Any]:
     """
-    Execute Python code with test cases and return results.
+    Execute code in the given language with test cases and return results.
     Returns: {
         'passed': bool,
         'testResults': List[Dict],
@@ -193,212 +264,220 @@ def execute_code(code: str, function_signature: str, test_cases: List[Dict]) ->
             'error': None
         }
     
-    try:
-        # Build the complete Python script
-        script = f"""
-{code}
-
-# Test runner
-import json
-test_results = []
-"""
-        
-        for i, test_case in enumerate(test_cases):
-            input_dict = test_case['input']
-            expected = test_case['expectedOutput']
-            
-            # Build function call from input
-            function_name = function_signature.split('(')[0].replace('def ', '').strip()
-            args_str = ', '.join([f"{k}={repr(v)}" for k, v in input_dict.items()])
-            
-            script += f"""
-try:
-    result_{i} = {function_name}({args_str})
-    expected_{i} = {repr(expected)}
-    passed_{i} = result_{i} == expected_{i}
-    test_results.append({{
-        'passed': passed_{i},
-        'input': {json.dumps(input_dict)},
-        'expected': expected_{i},
-        'actual': result_{i}
-    }})
-except Exception as e:
-    test_results.append({{
-        'passed': False,
-        'input': {json.dumps(input_dict)},
-        'expected': {repr(expected)},
-        'actual': None,
-        'error': str(e)
-    }})
-"""
-        
-        script += """
-print(json.dumps(test_results))
-"""
-        
-        # Execute with subprocess
-        process = subprocess.Popen(
-            ['python3', '-c', script],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        stdout, stderr = process.communicate(timeout=10)
-        
-        if process.returncode != 0:
-            return {
-                'passed': False,
-                'testResults': [],
-                'error': stderr or 'Execution failed'
-            }
-        
-        # Parse results
-        try:
-            test_results = json.loads(stdout.strip().split('\n')[-1])
-            all_passed = all(t.get('passed', False) for t in test_results)
-            return {
-                'passed': all_passed,
-                'testResults': test_results,
-                'error': None
-            }
-        except json.JSONDecodeError:
-            return {
-                'passed': False,
-                'testResults': [],
-                'error': 'Could not parse test results'
-            }
-            
-    except subprocess.TimeoutExpired:
+    runner = RUNNERS.get(language)
+    if not runner:
         return {
             'passed': False,
             'testResults': [],
-            'error': 'Code execution timed out (10 seconds max)'
+            'error': f'Unsupported language: {language}'
         }
+    
+    # Reject syntax errors, missing functions, banned imports and obvious
+    # infinite loops without paying for a sandbox run
+    if runner.screens:
+        rejection = runner.prescreen(code, function_signature)
+        record_prescreen(rejection)
+        if rejection:
+            return rejection
+    
+    run_start = time.perf_counter()
+    try:
+        return runner.run(code, function_signature, test_cases)
     except Exception as e:
         return {
             'passed': False,
             'testResults': [],
             'error': str(e)
         }
+    finally:
+        record_sandbox_spawn(time.perf_counter() - run_start, language)
+
+
+def record_prescreen(rejection: Optional[Dict[str, Any]]):
+    """Count a pre-screen outcome by rejection reason (screening runners only)"""
+    prescreen = metrics['prescreen']
+    prescreen['checked'] += 1
+    if rejection:
+        prescreen['rejected'] += 1
+        reason = rejection['prescreenReason']
+        prescreen['reasons'][reason] = prescreen['reasons'].get(reason, 0) + 1
+
+
+def record_sandbox_spawn(elapsed: float, language: str):
+    """Track wall time of one sandbox run (worker checkout through exit)"""
+    elapsed_ms = elapsed * 1000
+    sandbox = metrics['sandbox'].setdefault(language, {'spawns': 0, 'totalMs': 0.0, 'maxMs': 0.0})
+    sandbox['spawns'] += 1
+    sandbox['totalMs'] += elapsed_ms
+    sandbox['maxMs'] = max(sandbox['maxMs'], elapsed_ms)
+
+
+# Reward effect engine: each effect maps to a handler called with
+# (player_id, reward, targets, now_ms). `targets` is the alive-opponent list
+# computed once per event and `now_ms` is the single clock read for the event.
+REWARD_HANDLERS: Dict[str, Any] = {}
+
+# Effects whose target is chosen by the player; the handler runs from
+# apply_targeted_debuff once the target is known
+TARGETED_EFFECT_HANDLERS: Dict[str, Any] = {}
+
+
+def reward_effect(effect: str, needs_targets: bool = True):
+    """Register a handler for a reward effect"""
+    def register(handler):
+        handler.needs_targets = needs_targets
+        REWARD_HANDLERS[effect] = handler
+        return handler
+    return register
+
+
+def targeted_effect(effect: str):
+    """Register the handler that applies a targeted effect to the chosen player"""
+    def register(handler):
+        TARGETED_EFFECT_HANDLERS[effect] = handler
+
+        # Applying the reward itself just asks the player to pick a target
+        reward_effect(effect)(request_target_selection)
+        return handler
+    return register
+
+
+def alive_opponents(player_id: str, is_debug: bool = False) -> List[str]:
+    """Alive players other than player_id (self only as a debug fallback)"""
+    others = [pid for pid in alive_players if pid != player_id]
+    if is_debug and not others and player_id in alive_players:
+        others = [player_id]
+    return others
+
+
+def remove_time(target_id: str, seconds: int, now_ms: float):
+    """Take time off a player's timer without pushing it into the past"""
+    target = game_state['players'][target_id]
+    # seconds are from the reward, timerEndTime is in milliseconds
+    new_end_time = max(now_ms, target['timerEndTime'] - seconds * 1000)
+    publish_leaderboard([match_stats.record_time_change(target_id, new_end_time - target['timerEndTime'])])
+    target['timerEndTime'] = new_end_time
+
+
+def publish_leaderboard(rows: List[Optional[Dict[str, Any]]]):
+    """Broadcast changed leaderboard rows as a leaderboard_update delta"""
+    rows = [row for row in rows if row]
+    if rows:
+        socketio.emit('leaderboard_update', {'rows': rows}, room=PLAYER_ROOM)
 
 
 def apply_reward(player_id: str, reward: Dict[str, Any], is_debug: bool = False):
     """Apply reward to player(s)"""
-    if reward['effect'] == 'add_time':
-        if player_id in game_state['players']:
-            # reward['value'] is in seconds, timerEndTime is in milliseconds
-            game_state['players'][player_id]['timerEndTime'] += reward['value'] * 1000
-            emit('reward_applied', {
-                'playerId': player_id,
-                'effect': 'add_time',
-                'value': reward['value']
-            }, broadcast=True)
-    
-    elif reward['effect'] == 'remove_time':
-        # Select random other player
-        candidates = [pid for pid in game_state['players'].keys() if not game_state['players'][pid]['isEliminated']]
-        
-        # In normal mode, exclude self. In debug mode, allow self if no others exist.
-        other_players = [pid for pid in candidates if pid != player_id]
-        
-        if is_debug and not other_players and player_id in candidates:
-            other_players = [player_id]
-            print("Debug: Targeting self for remove_time")
-            
-        if other_players:
-            import random
-            target_id = random.choice(other_players)
-            # reward['value'] is in seconds, timerEndTime is in milliseconds
-            game_state['players'][target_id]['timerEndTime'] = max(
-                time.time() * 1000,  # Current time in milliseconds
-                game_state['players'][target_id]['timerEndTime'] - (reward['value'] * 1000)
-            )
-            emit('reward_applied', {
-                'playerId': target_id,
-                'effect': 'remove_time',
-                'value': reward['value'],
-                'fromPlayer': player_id
-            }, broadcast=True)
-    
-    elif reward['effect'] == 'remove_time_targeted':
-        # Request player to choose which opponent to target
-        candidates = [pid for pid in game_state['players'].keys() if not game_state['players'][pid]['isEliminated']]
-        other_players = [pid for pid in candidates if pid != player_id]
-        
-        if is_debug and not other_players and player_id in candidates:
-            other_players = [player_id]
-            
-        if other_players:
-            # Store pending reward in player state
-            game_state['players'][player_id]['pendingTargetedReward'] = reward
-            
-            # Emit event to player requesting target selection
-            emit('target_selection_required', {
-                'effect': reward['effect'],
-                'value': reward['value'],
-                'availableTargets': [{
-                    'playerId': pid,
-                    'username': game_state['players'][pid]['username'],
-                    'timeRemaining': max(0, int((game_state['players'][pid]['timerEndTime'] - time.time() * 1000) / 1000))
-                } for pid in other_players]
-            }, room=game_state['players'][player_id]['socket_id'])
-            print(f'Sent target selection request to {game_state["players"][player_id]["username"]}')
-    
-    elif reward['effect'] == 'flashbang_targeted':
-        # Request player to choose which opponent to flashbang
-        candidates = [pid for pid in game_state['players'].keys() if not game_state['players'][pid]['isEliminated']]
-        other_players = [pid for pid in candidates if pid != player_id]
-        
-        if is_debug and not other_players and player_id in candidates:
-            other_players = [player_id]
-            
-        if other_players:
-            # Store pending reward in player state
-            game_state['players'][player_id]['pendingTargetedReward'] = reward
-            
-            # Emit event to player requesting target selection
-            emit('target_selection_required', {
-                'effect': reward['effect'],
-                'value': reward['value'],
-                'availableTargets': [{
-                    'playerId': pid,
-                    'username': game_state['players'][pid]['username'],
-                    'timeRemaining': max(0, int((game_state['players'][pid]['timerEndTime'] - time.time() * 1000) / 1000))
-                } for pid in other_players]
-            }, room=game_state['players'][player_id]['socket_id'])
-            print(f'Sent flashbang target selection request to {game_state["players"][player_id]["username"]}')
-    
-    elif reward['effect'] == 'remove_time_all':
-        # Remove time from ALL other players
-        candidates = [pid for pid in game_state['players'].keys() if not game_state['players'][pid]['isEliminated']]
-        other_players = [pid for pid in candidates if pid != player_id]
-        
-        if is_debug and not other_players and player_id in candidates:
-            other_players = [player_id]
-            
-        if other_players:
-            affected_players = []
-            for target_id in other_players:
-                game_state['players'][target_id]['timerEndTime'] = max(
-                    time.time() * 1000,
-                    game_state['players'][target_id]['timerEndTime'] - (reward['value'] * 1000)
-                )
-                affected_players.append({
-                    'playerId': target_id,
-                    'username': game_state['players'][target_id]['username']
-                })
-        
-        if affected_players:
-            emit('reward_applied', {
-                'effect': 'remove_time_all',
-                'value': reward['value'],
-                'fromPlayer': player_id,
-                'affectedPlayers': affected_players
-            }, broadcast=True)
-            print(f'Applied remove_time_all: {reward["value"]}s from {len(affected_players)} players')
+    handler = REWARD_HANDLERS.get(reward['effect'])
+    if not handler:
+        print(f'Unknown reward effect: {reward["effect"]}')
+        return
+
+    targets = alive_opponents(player_id, is_debug) if handler.needs_targets else []
+    handler(player_id, reward, targets, time.time() * 1000)
+
+
+@reward_effect('add_time', needs_targets=False)
+def apply_add_time(player_id, reward, targets, now_ms):
+    if player_id in game_state['players']:
+        # reward['value'] is in seconds, timerEndTime is in milliseconds
+        game_state['players'][player_id]['timerEndTime'] += reward['value'] * 1000
+        publish_leaderboard([match_stats.record_time_change(player_id, reward['value'] * 1000)])
+        emit('reward_applied', {
+            'playerId': player_id,
+            'effect': 'add_time',
+            'value': reward['value']
+        }, room=PLAYER_ROOM)
+
+
+@reward_effect('remove_time')
+def apply_remove_time(player_id, reward, targets, now_ms):
+    # Select random other player
+    if targets:
+        import random
+        target_id = random.choice(targets)
+        remove_time(target_id, reward['value'], now_ms)
+        emit('reward_applied', {
+            'playerId': target_id,
+            'effect': 'remove_time',
+            'value': reward['value'],
+            'fromPlayer': player_id
+        }, room=PLAYER_ROOM)
+
+
+@reward_effect('remove_time_all')
+def apply_remove_time_all(player_id, reward, targets, now_ms):
+    # Remove time from ALL other players in one pass, one broadcast
+    if not targets:
+        return
+
+    players = game_state['players']
+    delta_ms = reward['value'] * 1000
+    affected_players = []
+    changed_rows = []
+    for target_id in targets:
+        target = players[target_id]
+        new_end_time = max(now_ms, target['timerEndTime'] - delta_ms)
+        changed_rows.append(match_stats.record_time_change(target_id, new_end_time - target['timerEndTime']))
+        target['timerEndTime'] = new_end_time
+        affected_players.append({'playerId': target_id, 'username': target['username']})
+    publish_leaderboard(changed_rows)
+
+    emit('reward_applied', {
+        'effect': 'remove_time_all',
+        'value': reward['value'],
+        'fromPlayer': player_id,
+        'affectedPlayers': affected_players
+    }, room=PLAYER_ROOM)
+    print(f'Applied remove_time_all: {reward["value"]}s from {len(affected_players)} players')
+
+
+def request_target_selection(player_id, reward, targets, now_ms):
+    """Store the pending reward and ask the player which opponent to target"""
+    if not targets:
+        return
+
+    players = game_state['players']
+    player = players[player_id]
+    player['pendingTargetedReward'] = reward
+
+    emit('target_selection_required', {
+        'effect': reward['effect'],
+        'value': reward['value'],
+        'availableTargets': [{
+            'playerId': pid,
+            'username': players[pid]['username'],
+            'timeRemaining': max(0, int((players[pid]['timerEndTime'] - now_ms) / 1000))
+        } for pid in targets]
+    }, room=player['socket_id'])
+    print(f'Sent {reward["effect"]} target selection request to {player["username"]}')
 
 
+@targeted_effect('remove_time_targeted')
+def apply_remove_time_targeted(player, target_player, reward, now_ms):
+    remove_time(target_player['id'], reward['value'], now_ms)
+
+    # Broadcast the reward application
+    emit('reward_applied', {
+        'playerId': target_player['id'],
+        'effect': 'remove_time_targeted',
+        'value': reward['value'],
+        'fromPlayer': player['id'],
+        'targetName': target_player['username']
+    }, room=PLAYER_ROOM)
+
+    print(f'Player {player["username"]} targeted {target_player["username"]} with {reward["value"]}s debuff')
+
+
+@targeted_effect('flashbang_targeted')
+def apply_flashbang_targeted(player, target_player, reward, now_ms):
+    # Apply flashbang to target player only
+    emit('flashbang_applied', {
+        'fromPlayer': player['id'],
+        'fromUsername': player['username']
+    }, room=target_player['socket_id'])
+
+    print(f'Player {player["username"]} flashbanged {target_player["username"]}')
 
 
 def check_win_condition():
@@ -409,25 +488,82 @@ def check_win_condition():
     if len(active_players) == 1:
         game_state['gameStatus'] = 'ended'
         game_state['winner'] = active_players[0]
+        archive_match()
         emit('game_ended', {
             'winner': game_state['winner'],
             'winnerName': game_state['players'][active_players[0]]['username']
-        }, broadcast=True)
+        }, room=PLAYER_ROOM)
+        release_players()
         return True
     elif len(active_players) == 0:
         game_state['gameStatus'] = 'ended'
-        emit('game_ended', {'winner': None}, broadcast=True)
+        archive_match()
+        emit('game_ended', {'winner': None}, room=PLAYER_ROOM)
+        release_players()
         return True
     return False
 
 
+def release_players():
+    """
+    Free a finished match's sockets so they can queue or join again. Their
+    player records stay in the room for the results until reset_room.
+    """
+    for p in game_state['players'].values():
+        if socket_to_player.get(p['socket_id']) == p['id']:
+            del socket_to_player[p['socket_id']]
+            socketio.server.leave_room(p['socket_id'], PLAYER_ROOM, namespace='/')
+
+
+def archive_match():
+    """Store the finished match's summary in match_history"""
+    if match_stats.started_at is None:
+        return
+    match_history.append(match_stats.summary(game_state['winner'], time.time() * 1000))
+    match_stats.started_at = None
+
+
 @app.route('/')
 def index():
     return {'status': 'CodeBattles Server Running', 'players': len(game_state['players'])}
 
 
+@app.route('/metrics')
+def get_metrics():
+    return {
+        'startup': metrics['startup'],
+        'sandbox': {language: {
+            'spawns': sandbox['spawns'],
+            'avgMs': round(sandbox['totalMs'] / sandbox['spawns'], 1),
+            'maxMs': round(sandbox['maxMs'], 1)
+        } for language, sandbox in metrics['sandbox'].items()},
+        'prescreen': {
+            **metrics['prescreen'],
+            'rejectionRate': round(metrics['prescreen']['rejected'] / metrics['prescreen']['checked'], 3)
+            if metrics['prescreen']['checked'] else None
+        },
+        'spectators': metrics['spectators'],
+        'matchmaking': {
+            'queued': len(matchmaking_queue),
+            'waitMs': matchmaking_queue.wait_percentiles()
+        }
+    }
+
+
+@app.route('/leaderboard')
+def get_leaderboard():
+    return {
+        'gameStatus': game_state['gameStatus'],
+        'leaderboard': match_stats.leaderboard(),
+        'recentMatches': list(match_history)
+    }
+
+
 @socketio.on('connect')
 def handle_connect():
+    if metrics['startup']['firstConnectionMs'] is None:
+        metrics['startup']['firstConnectionMs'] = round((time.perf_counter() - _process_start) * 1000, 1)
+        print(f'First connection accepted {metrics["startup"]["firstConnectionMs"]}ms after process start')
     print(f'Client connected: {request.sid}')
     emit('connected', {'socketId': request.sid})
 
@@ -437,16 +573,24 @@ def handle_disconnect():
     socket_id = request.sid
     print(f'Client disconnected: {socket_id}')
     
+    matchmaking_queue.remove(socket_id)
+    spectator_sockets.discard(socket_id)
+    metrics['spectators']['count'] = len(spectator_sockets)
+    
     # Find and remove player
     if socket_id in socket_to_player:
         player_id = socket_to_player[socket_id]
         if player_id in game_state['players']:
             player_name = game_state['players'][player_id]['username']
+            # Leaving mid-match counts as an elimination for placement
+            if not game_state['players'][player_id]['isEliminated']:
+                publish_leaderboard([match_stats.record_elimination(player_id, time.time() * 1000)])
             del game_state['players'][player_id]
+            alive_players.pop(player_id, None)
             emit('player_left', {
                 'playerId': player_id,
                 'username': player_name
-            }, broadcast=True)
+            }, room=PLAYER_ROOM)
         
         del socket_to_player[socket_id]
         
@@ -466,11 +610,41 @@ def handle_join_room(data):
     
     socket_id = request.sid
     
+    if socket_id in spectator_sockets:
+        emit('join_error', {'message': 'Spectators cannot join as players'})
+        return
+    
+    if socket_id in matchmaking_queue:
+        emit('join_error', {'message': 'Leave the matchmaking queue before joining a room'})
+        return
+    
+    # A finished match stays on screen until someone starts the next one
+    if game_state['gameStatus'] == 'ended':
+        reset_room()
+    
+    player_id = create_player(username, socket_id)
+    
+    # Broadcast to all players
+    emit('player_joined', {
+        'playerId': player_id,
+        'username': username
+    }, room=PLAYER_ROOM)
+    
+    # Send current game state to new player
+    emit('game_state', game_state, room=socket_id)
+    
+    print(f'Player {username} ({player_id}) joined room {room_code}')
+
+
+def create_player(username: str, socket_id: str) -> str:
+    """Create a player in the room and map the socket to it"""
     # Generate player ID
     player_id = str(uuid.uuid4())
     
-    # Map socket to player
+    # Map socket to player (server-level enter_room, since the matchmaker
+    # calls this outside a request and app context)
     socket_to_player[socket_id] = player_id
+    socketio.server.enter_room(socket_id, PLAYER_ROOM, namespace='/')
     
     # Create player
     player = {
@@ -481,23 +655,15 @@ def handle_join_room(data):
         'isEliminated': False,
         'eliminatedAt': None,  # Timestamp when player was eliminated
         'currentProblem': None,
+        'selectedAt': None,  # When currentProblem was picked, for submission latency
         'cards': [],
         'isTimeFrozen': False,
         'frozenUntil': None
     }
     
     game_state['players'][player_id] = player
-    
-    # Broadcast to all clients
-    emit('player_joined', {
-        'playerId': player_id,
-        'username': username
-    }, broadcast=True)
-    
-    # Send current game state to new player
-    emit('game_state', game_state, room=socket_id)
-    
-    print(f'Player {username} ({player_id}) joined room {room_code}')
+    alive_players[player_id] = None
+    return player_id
 
 
 @socketio.on('start_game')
@@ -521,6 +687,13 @@ def handle_start_game():
         emit('error', {'message': 'Only host can start game'})
         return
     
+    start_game()
+    
+    print(f'Game started by {game_state["players"][player_id]["username"]}')
+
+
+def start_game():
+    """Start the match - set timers and deal cards to all players"""
     # Set game status
     game_state['gameStatus'] = 'playing'
     
@@ -529,13 +702,19 @@ def handle_start_game():
     for pid in game_state['players'].keys():
         game_state['players'][pid]['timerEndTime'] = timer_end_time
     
+    # Fresh aggregates for this match
+    match_stats.reset()
+    match_stats.started_at = time.time() * 1000
+    for pid, p in game_state['players'].items():
+        match_stats.add_player(pid, p['username'])
+    
     # Deal 5 cards to each player
     for pid in game_state['players'].keys():
         cards = [generate_card() for _ in range(5)]
         game_state['players'][pid]['cards'] = cards
     
-    # Broadcast game started
-    emit('game_started', {
+    # Broadcast game started (socketio.emit so the matchmaker can call this too)
+    socketio.emit('game_started', {
         'players': {pid: {
             'id': p['id'],
             'username': p['username'],
@@ -545,9 +724,7 @@ def handle_start_game():
             'currentProblem': p['currentProblem'],
             'cards': p['cards']
         } for pid, p in game_state['players'].items()}
-    }, broadcast=True)
-    
-    print(f'Game started by {game_state["players"][player_id]["username"]}')
+    }, room=PLAYER_ROOM)
 
 
 @socketio.on('select_card')
@@ -576,13 +753,14 @@ def handle_select_card(data):
     
     # Update current problem
     player['currentProblem'] = card_id
+    player['selectedAt'] = time.time() * 1000
     
-    # Broadcast to all clients
+    # Broadcast to all players
     emit('card_selected', {
         'playerId': player_id,
         'cardId': card_id,
         'problem': card['problem']
-    }, broadcast=True)
+    }, room=PLAYER_ROOM)
     
     print(f'Player {player["username"]} selected card {card_id}')
 
@@ -599,6 +777,7 @@ def handle_submit_solution(data):
     player_id = socket_to_player[socket_id]
     card_id = data.get('cardId')
     code = data.get('code', '')
+    language = data.get('language', DEFAULT_LANGUAGE)
     
     if player_id not in game_state['players']:
         emit('error', {'message': 'Player not found'})
@@ -625,7 +804,10 @@ def handle_submit_solution(data):
     function_signature = card['problem']['functionSignature']
     test_cases = card['problem']['testCases']
     
-    result = execute_code(code, function_signature, test_cases)
+    result = execute_code(code, function_signature, test_cases, language)
+    
+    latency_ms = time.time() * 1000 - (player.get('selectedAt') or time.time() * 1000)
+    publish_leaderboard([match_stats.record_submission(player_id, result['passed'], latency_ms)])
     
     if result['passed']:
         # Remove card from hand
@@ -644,9 +826,10 @@ def handle_submit_solution(data):
         emit('solution_passed', {
             'playerId': player_id,
             'cardId': card_id,
+            'language': language,
             'testResults': result['testResults'],
             'newCard': new_card
-        }, broadcast=True)
+        }, room=PLAYER_ROOM)
         
         print(f'Player {player["username"]} passed problem {card["problem"]["title"]}')
     else:
@@ -654,9 +837,10 @@ def handle_submit_solution(data):
         emit('solution_failed', {
             'playerId': player_id,
             'cardId': card_id,
+            'language': language,
             'error': result['error'],
             'testResults': result['testResults']
-        }, broadcast=True)
+        }, room=PLAYER_ROOM)
         
         print(f'Player {player["username"]} failed problem {card["problem"]["title"]}')
 
@@ -683,15 +867,17 @@ def handle_player_eliminated(data):
     
     # Mark as eliminated
     player['isEliminated'] = True
+    alive_players.pop(player_id, None)
     player['eliminatedAt'] = time.time() * 1000  # Timestamp in milliseconds
     player['timeRemaining'] = 0
+    publish_leaderboard([match_stats.record_elimination(player_id, player['eliminatedAt'])])
     
     # Broadcast elimination
     emit('player_eliminated', {
         'playerId': player_id,
         'username': player['username'],
         'eliminatedAt': player['eliminatedAt']
-    }, broadcast=True)
+    }, room=PLAYER_ROOM)
     
     print(f'Player {player["username"]} eliminated')
     
@@ -739,33 +925,9 @@ def handle_apply_targeted_debuff(data):
     
     # Apply the debuff based on effect type
     reward = player['pendingTargetedReward']
-    
-    if reward['effect'] == 'remove_time_targeted':
-        # Apply time removal
-        game_state['players'][target_id]['timerEndTime'] = max(
-            time.time() * 1000,
-            game_state['players'][target_id]['timerEndTime'] - (reward['value'] * 1000)
-        )
-        
-        # Broadcast the reward application
-        emit('reward_applied', {
-            'playerId': target_id,
-            'effect': 'remove_time_targeted',
-            'value': reward['value'],
-            'fromPlayer': player_id,
-            'targetName': game_state['players'][target_id]['username']
-        }, broadcast=True)
-        
-        print(f'Player {player["username"]} targeted {target_player["username"]} with {reward["value"]}s debuff')
-    
-    elif reward['effect'] == 'flashbang_targeted':
-        # Apply flashbang to target player only
-        emit('flashbang_applied', {
-            'fromPlayer': player_id,
-            'fromUsername': player['username']
-        }, room=target_player['socket_id'])
-        
-        print(f'Player {player["username"]} flashbanged {target_player["username"]}')
+    handler = TARGETED_EFFECT_HANDLERS.get(reward['effect'])
+    if handler:
+        handler(player, target_player, reward, time.time() * 1000)
     
     # Clear pending reward
     player['pendingTargetedReward'] = None
@@ -788,6 +950,197 @@ def handle_debug_trigger_reward(data):
 
 
 
+@socketio.on('enqueue_match')
+def handle_enqueue_match(data):
+    """Handle player entering the public matchmaking queue"""
+    global matchmaker_started
+    username = data.get('username', '').strip()
+    
+    if not username:
+        emit('join_error', {'message': 'Username required'})
+        return
+    
+    socket_id = request.sid
+    
+    if socket_id in socket_to_player or socket_id in spectator_sockets:
+        emit('error', {'message': 'Already in a game'})
+        return
+    
+    try:
+        rating = int(data.get('rating', 1000))
+    except (TypeError, ValueError):
+        rating = 1000
+    
+    entry = matchmaking_queue.enqueue(socket_id, username, rating, time.time())
+    emit('match_queued', {'rating': entry['rating'], 'queueSize': len(matchmaking_queue)})
+    
+    # Matcher only runs once someone has actually queued
+    if not matchmaker_started:
+        matchmaker_started = True
+        socketio.start_background_task(run_matchmaker)
+    
+    print(f'Player {username} queued for a match (rating {rating})')
+
+
+@socketio.on('leave_match_queue')
+def handle_leave_match_queue():
+    """Handle player leaving the matchmaking queue"""
+    if matchmaking_queue.remove(request.sid):
+        emit('match_queue_left', {})
+
+
+def reset_room():
+    """Clear a finished match so the room can be reused"""
+    socketio.emit('room_reset', {'roomCode': game_state['roomCode']}, room=PLAYER_ROOM)
+    release_players()
+    game_state['players'] = {}
+    alive_players.clear()
+    game_state['gameStatus'] = 'lobby'
+    game_state['winner'] = None
+
+
+def run_matchmaker():
+    """Periodically form a room from the queue while the room is free"""
+    while True:
+        socketio.sleep(MATCHMAKER_INTERVAL)
+        # Keep the loop alive: one failed pass must not stop matchmaking
+        try:
+            match_once()
+        except Exception as e:
+            print(f'Matchmaker error: {e!r}')
+
+
+def match_once():
+    """Place one matched group into the room and start it, if possible"""
+    # Single room system: only place a group into a free room
+    if game_state['gameStatus'] == 'playing':
+        return
+    if game_state['gameStatus'] == 'lobby' and game_state['players']:
+        return
+    
+    group = matchmaking_queue.next_group(time.time())
+    if not group:
+        return
+    
+    if game_state['gameStatus'] == 'ended':
+        reset_room()
+    
+    for entry in group:
+        player_id = create_player(entry['username'], entry['socketId'])
+        # match_found carries the client's own player ID; player_joined
+        # is the same broadcast a manual join_room sends
+        socketio.emit('match_found', {
+            'playerId': player_id,
+            'username': entry['username'],
+            'roomCode': game_state['roomCode'],
+            'players': [e['username'] for e in group]
+        }, room=entry['socketId'])
+        socketio.emit('player_joined', {
+            'playerId': player_id,
+            'username': entry['username']
+        }, room=PLAYER_ROOM)
+    
+    for entry in group:
+        socketio.emit('game_state', game_state, room=entry['socketId'])
+    
+    start_game()
+    
+    print(f'Matchmaker started a game with {len(group)} players')
+
+
+@socketio.on('join_spectator')
+def handle_join_spectator():
+    """Handle a read-only spectator joining the broadcast feed"""
+    global spectator_feed_started
+    socket_id = request.sid
+    
+    if socket_id in socket_to_player or socket_id in matchmaking_queue:
+        emit('error', {'message': 'Players cannot spectate'})
+        return
+    
+    join_socket_room(SPECTATOR_ROOM)
+    spectator_sockets.add(socket_id)
+    metrics['spectators']['count'] = len(spectator_sockets)
+    
+    # Catch the new spectator up with the current frame instead of waiting a tick
+    if last_spectator_frame is not None:
+        emit('spectator_frame', last_spectator_frame)
+    
+    # Feed only runs once someone is watching
+    if not spectator_feed_started:
+        spectator_feed_started = True
+        socketio.start_background_task(run_spectator_feed)
+    
+    print(f'Spectator joined: {socket_id} ({len(spectator_sockets)} watching)')
+
+
+@socketio.on('leave_spectator')
+def handle_leave_spectator():
+    """Handle a spectator leaving the broadcast feed"""
+    leave_socket_room(SPECTATOR_ROOM)
+    spectator_sockets.discard(request.sid)
+    metrics['spectators']['count'] = len(spectator_sockets)
+
+
+def build_spectator_frame() -> Dict[str, Any]:
+    """Aggregated room view for spectators: leaderboard order and timers"""
+    players = game_state['players'].values()
+    # Alive players by most time left, then eliminated players by latest elimination
+    ranked = sorted(
+        players,
+        key=lambda p: (p['isEliminated'], -(p['eliminatedAt'] or p['timerEndTime'] or 0))
+    )
+    return {
+        'gameStatus': game_state['gameStatus'],
+        'winner': game_state['winner'],
+        'leaderboard': [{
+            'playerId': p['id'],
+            'username': p['username'],
+            'timerEndTime': p['timerEndTime'],
+            'isEliminated': p['isEliminated'],
+            'eliminatedAt': p['eliminatedAt']
+        } for p in ranked]
+    }
+
+
+def run_spectator_feed():
+    """Push one spectator frame per tick"""
+    while True:
+        socketio.sleep(SPECTATOR_INTERVAL)
+        # Keep the loop alive: one failed frame must not stop the feed
+        try:
+            publish_spectator_frame()
+        except Exception as e:
+            print(f'Spectator feed error: {e!r}')
+
+
+def publish_spectator_frame():
+    """
+    Send the current frame to the spectator room. A single room emit means
+    the packet is encoded once and the same bytes go to every spectator
+    socket. Unchanged frames (compared by their JSON encoding) are not resent;
+    clients interpolate timers from timerEndTime.
+    """
+    global last_spectator_frame, last_spectator_encoding
+    stats = metrics['spectators']
+    
+    if not spectator_sockets:
+        return
+    
+    cpu_start = time.process_time()
+    frame = build_spectator_frame()
+    encoding = json.dumps(frame, separators=(',', ':'))
+    if encoding == last_spectator_encoding:
+        return
+    last_spectator_frame, last_spectator_encoding = frame, encoding
+    socketio.emit('spectator_frame', frame, room=SPECTATOR_ROOM)
+    
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+    stats['framesSent'] += 1
+    stats['lastFrameCpuMs'] = round(cpu_ms, 3)
+    stats['cpuPerSpectatorUs'] = round(cpu_ms * 1000 / len(spectator_sockets), 2)
+
+
 @socketio.on('get_game_state')
 def handle_get_game_state():
     """Send current game state to requesting client"""
@@ -805,7 +1158,7 @@ def handle_test_message(data):
         emit('test_message', {
             'from': from_name,
             'message': message
-        }, broadcast=True, include_self=True)
+        }, broadcast=True, include_self=True, skip_sid=list(spectator_sockets))
         
         print(f'Test message from {from_name}: {message}')
 
@@ -814,6 +1167,9 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     host = os.getenv('HOST', '0.0.0.0')
     
+    startup = metrics['startup']
+    print(f'Startup: monkey_patch {startup["monkeyPatchMs"]}ms, imports {startup["importsMs"]}ms, app init {startup["appInitMs"]}ms')
+    print('For a per-module import breakdown run: python -X importtime app.py')
     print(f'Starting server on {host}:{port}')
     print(f'Connect frontend to: http://localhost:{port}')
     print(f'For ngrok: Use the ngrok URL when running ngrok http {port}')
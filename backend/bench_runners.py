@@ -0,0 +1,68 @@
+"""
+Per-language execution benchmark: latency and throughput of the runners
+used by execute_code, with a cold spawn per run versus the warm pool.
+
+    python bench_runners.py [runs]
+"""
+import sys
+import time
+
+from runners import WorkerPool, available_runners
+
+FUNCTION_SIGNATURE = 'def twoSum(nums: list, target: int) -> list:'
+TEST_CASES = [
+    {'input': {'nums': [2, 7, 11, 15], 'target': 9}, 'expectedOutput': [0, 1]},
+    {'input': {'nums': [3, 2, 4], 'target': 6}, 'expectedOutput': [1, 2]},
+    {'input': {'nums': [3, 3], 'target': 6}, 'expectedOutput': [0, 1]}
+]
+SOLUTIONS = {
+    'python': (
+        'def twoSum(nums, target):\n'
+        '    seen = {}\n'
+        '    for i, n in enumerate(nums):\n'
+        '        if target - n in seen:\n'
+        '            return [seen[target - n], i]\n'
+        '        seen[n] = i\n'
+    ),
+    'javascript': (
+        'function twoSum(nums, target) {\n'
+        '  const seen = new Map();\n'
+        '  for (let i = 0; i < nums.length; i++) {\n'
+        '    if (seen.has(target - nums[i])) return [seen.get(target - nums[i]), i];\n'
+        '    seen.set(nums[i], i);\n'
+        '  }\n'
+        '}\n'
+    )
+}
+
+
+def bench(runner, code: str, runs: int):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(runs):
+        run_start = time.perf_counter()
+        result = runner.run(code, FUNCTION_SIGNATURE, TEST_CASES)
+        latencies.append((time.perf_counter() - run_start) * 1000)
+        if not result['passed']:
+            raise RuntimeError(f'{runner.language} benchmark solution failed: {result["error"]}')
+        # Leave the pool time to warm back up, as between real submissions
+        time.sleep(0.1)
+    elapsed = time.perf_counter() - start - 0.1 * runs
+    latencies.sort()
+    return {
+        'p50Ms': round(latencies[len(latencies) // 2], 1),
+        'p95Ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+        'runsPerSec': round(runs / elapsed, 1)
+    }
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    for language, runner in available_runners().items():
+        warm_pool = runner.pool
+        runner.pool = WorkerPool(runner.command, size=0)
+        cold = bench(runner, SOLUTIONS[language], runs)
+        runner.pool = warm_pool
+        warm = bench(runner, SOLUTIONS[language], runs)
+        warm_pool.shutdown()
+        print(f'{language:<12} cold {cold}  warm {warm}')
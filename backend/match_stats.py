@@ -0,0 +1,120 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class MatchStats:
+    """
+    Incremental per-match aggregates. Each player has a stats row, and the
+    ranking is a sorted list of (-solves, -timeGainedMs, joinOrder, playerId)
+    kept in order with bisect, so an update repositions one row instead of
+    re-sorting the room. Eliminations are kept sorted by eliminatedAt for
+    placement.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self.ranking: List[Tuple[int, float, int, str]] = []
+        self.eliminations: List[Tuple[float, str]] = []
+        self.started_at: Optional[float] = None
+        self._join_order = 0
+
+    def _key(self, row: Dict[str, Any]) -> Tuple[int, float, int, str]:
+        return (-row['solves'], -row['timeGainedMs'], row['joinOrder'], row['playerId'])
+
+    def add_player(self, player_id: str, username: str):
+        if player_id in self.players:
+            return
+        row = {
+            'playerId': player_id,
+            'username': username,
+            'joinOrder': self._join_order,
+            'solves': 0,
+            'failures': 0,
+            'timeGainedMs': 0,
+            'timeLostMs': 0,
+            'latencyTotalMs': 0.0,
+            'eliminatedAt': None
+        }
+        self._join_order += 1
+        self.players[player_id] = row
+        insort(self.ranking, self._key(row))
+
+    def _update(self, player_id: str, **changes) -> Optional[Dict[str, Any]]:
+        row = self.players.get(player_id)
+        if not row:
+            return None
+        old_key = self._key(row)
+        for field, delta in changes.items():
+            row[field] += delta
+        new_key = self._key(row)
+        if new_key != old_key:
+            del self.ranking[bisect_left(self.ranking, old_key)]
+            insort(self.ranking, new_key)
+        return self.row_view(player_id)
+
+    def record_submission(self, player_id: str, passed: bool, latency_ms: float) -> Optional[Dict[str, Any]]:
+        """Count a graded submission and its latency from card selection"""
+        if passed:
+            return self._update(player_id, solves=1, latencyTotalMs=latency_ms)
+        return self._update(player_id, failures=1, latencyTotalMs=latency_ms)
+
+    def record_time_change(self, player_id: str, delta_ms: float) -> Optional[Dict[str, Any]]:
+        """Count time gained (positive) or lost (negative) through rewards"""
+        if delta_ms >= 0:
+            return self._update(player_id, timeGainedMs=delta_ms)
+        return self._update(player_id, timeLostMs=-delta_ms)
+
+    def record_elimination(self, player_id: str, eliminated_at: float) -> Optional[Dict[str, Any]]:
+        row = self.players.get(player_id)
+        if not row or row['eliminatedAt'] is not None:
+            return None
+        row['eliminatedAt'] = eliminated_at
+        insort(self.eliminations, (eliminated_at, player_id))
+        return self.row_view(player_id)
+
+    def rank(self, player_id: str) -> int:
+        """1-based leaderboard position"""
+        return bisect_left(self.ranking, self._key(self.players[player_id])) + 1
+
+    def placement(self, player_id: str) -> Optional[int]:
+        """Final placement from elimination order; None while still alive"""
+        row = self.players[player_id]
+        if row['eliminatedAt'] is None:
+            return None
+        # Everyone still alive, plus everyone eliminated later, placed ahead
+        alive = len(self.players) - len(self.eliminations)
+        later = len(self.eliminations) - bisect_left(self.eliminations, (row['eliminatedAt'], player_id)) - 1
+        return alive + later + 1
+
+    def row_view(self, player_id: str) -> Dict[str, Any]:
+        row = self.players[player_id]
+        graded = row['solves'] + row['failures']
+        return {
+            'playerId': player_id,
+            'username': row['username'],
+            'rank': self.rank(player_id),
+            'solves': row['solves'],
+            'timeGainedMs': row['timeGainedMs'],
+            'timeLostMs': row['timeLostMs'],
+            'avgLatencyMs': round(row['latencyTotalMs'] / graded, 1) if graded else None,
+            'placement': self.placement(player_id)
+        }
+
+    def leaderboard(self) -> List[Dict[str, Any]]:
+        return [self.row_view(key[3]) for key in self.ranking]
+
+    def summary(self, winner: Optional[str], ended_at: float) -> Dict[str, Any]:
+        """Archive record for a finished match"""
+        rows = self.leaderboard()
+        for row in rows:
+            if row['playerId'] == winner:
+                row['placement'] = 1
+        return {
+            'startedAt': self.started_at,
+            'endedAt': ended_at,
+            'winner': winner,
+            'players': sorted(rows, key=lambda r: (r['placement'] is None, r['placement'] or 0, r['rank']))
+        }
@@ -0,0 +1,115 @@
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Tuple
+
+
+class MatchmakingQueue:
+    """
+    Players waiting for a match, indexed by rating bucket and join time.
+    Each bucket is a heap of (joinedAt, token, socket_id), so enqueue is
+    O(log n). Removals are lazy: the entry is dropped from `entries` and its
+    heap item is skipped when it surfaces. The per-enqueue token tells a
+    live item from one left behind by an earlier enqueue of the same socket.
+    """
+
+    def __init__(self, room_size: int = 4, min_room_size: int = 2,
+                 bucket_width: int = 200, max_wait: float = 30.0):
+        self.room_size = room_size
+        self.min_room_size = min_room_size
+        self.bucket_width = bucket_width
+        self.max_wait = max_wait
+        self.buckets: Dict[int, List[Tuple[float, int, str]]] = {}
+        self.bucket_counts: Dict[int, int] = {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.wait_times: Deque[float] = deque(maxlen=1000)
+        self._next_token = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, socket_id: str) -> bool:
+        return socket_id in self.entries
+
+    def enqueue(self, socket_id: str, username: str, rating: int, now: float) -> Dict[str, Any]:
+        """Add a player to the bucket for their rating"""
+        if socket_id in self.entries:
+            return self.entries[socket_id]
+        bucket = rating // self.bucket_width
+        entry = {
+            'socketId': socket_id,
+            'username': username,
+            'rating': rating,
+            'bucket': bucket,
+            'joinedAt': now,
+            'token': self._next_token
+        }
+        self._next_token += 1
+        self.entries[socket_id] = entry
+        heapq.heappush(self.buckets.setdefault(bucket, []), (now, entry['token'], socket_id))
+        self.bucket_counts[bucket] = self.bucket_counts.get(bucket, 0) + 1
+        return entry
+
+    def remove(self, socket_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a player from the queue (e.g. on disconnect)"""
+        entry = self.entries.pop(socket_id, None)
+        if entry:
+            self.bucket_counts[entry['bucket']] -= 1
+        return entry
+
+    def _is_live(self, item: Tuple[float, int, str]) -> bool:
+        entry = self.entries.get(item[2])
+        return entry is not None and entry['token'] == item[1]
+
+    def _prune(self, heap: List[Tuple[float, int, str]]):
+        # Drop stale heads so heap[0] is always a queued player
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+
+    def _pop_group(self, heap: List[Tuple[float, int, str]], size: int, now: float) -> List[Dict[str, Any]]:
+        group = []
+        while heap and len(group) < size:
+            item = heapq.heappop(heap)
+            if self._is_live(item):
+                entry = self.entries.pop(item[2])
+                self.bucket_counts[entry['bucket']] -= 1
+                self.wait_times.append(now - entry['joinedAt'])
+                group.append(entry)
+        return group
+
+    def next_group(self, now: float) -> Optional[List[Dict[str, Any]]]:
+        """
+        Form one room from the bucket whose oldest player has waited longest.
+        A full room is formed as soon as a bucket has `room_size` players;
+        after `max_wait` seconds a bucket with `min_room_size` players is
+        started short-handed rather than leaving its players waiting.
+        """
+        best = None
+        for bucket, heap in list(self.buckets.items()):
+            size = self.bucket_counts.get(bucket, 0)
+            if size == 0:
+                del self.buckets[bucket]
+                self.bucket_counts.pop(bucket, None)
+                continue
+            self._prune(heap)
+            oldest = heap[0][0]
+            ready = size >= self.room_size or (
+                size >= self.min_room_size and now - oldest >= self.max_wait
+            )
+            if ready and (best is None or oldest < best[0]):
+                best = (oldest, bucket, min(size, self.room_size))
+
+        if best is None:
+            return None
+        _, bucket, size = best
+        return self._pop_group(self.buckets[bucket], size, now)
+
+    def wait_percentiles(self) -> Dict[str, Optional[float]]:
+        """p50/p90/p99 of recent queue waits, in milliseconds"""
+        if not self.wait_times:
+            return {'p50': None, 'p90': None, 'p99': None}
+        ordered = sorted(self.wait_times)
+        last = len(ordered) - 1
+        return {
+            f'p{p}': round(ordered[min(last, int(last * p / 100))] * 1000, 1)
+            for p in (50, 90, 99)
+        }
@@ -0,0 +1,131 @@
+import ast
+from typing import Dict, Any, Optional, Tuple
+
+# Top-level modules submissions may not import
+DISALLOWED_IMPORTS = {'os', 'subprocess', 'socket'}
+
+
+def parse_signature(function_signature: str) -> Tuple[str, list]:
+    """Function name and parameter names from a problem's functionSignature"""
+    tree = ast.parse(function_signature.rstrip() + '\n    pass')
+    func = tree.body[0]
+    return func.name, [arg.arg for arg in func.args.posonlyargs + func.args.args + func.args.kwonlyargs]
+
+
+def _reject(reason: str, error: str) -> Dict[str, Any]:
+    return {
+        'passed': False,
+        'testResults': [],
+        'error': error,
+        'prescreenReason': reason
+    }
+
+
+def _check_arguments(func: ast.FunctionDef, params: list) -> Optional[str]:
+    # The harness calls the function with keyword arguments named as in the signature
+    args = func.args
+    accepted = [a.arg for a in args.args + args.kwonlyargs]
+    missing = [p for p in params if p not in accepted]
+    if missing and not args.kwarg:
+        return f'{func.name}() must accept parameter(s): {", ".join(missing)}'
+
+    positional_defaults = len(args.defaults)
+    required = [a.arg for a in args.args[:len(args.args) - positional_defaults]]
+    required += [a.arg for a, d in zip(args.kwonlyargs, args.kw_defaults) if d is None]
+    extra = [r for r in required if r not in params]
+    if extra or args.posonlyargs:
+        names = extra + [a.arg for a in args.posonlyargs]
+        return f'{func.name}() has parameter(s) the tests do not provide: {", ".join(names)}'
+    return None
+
+
+def _is_constant_true(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and bool(node.value)
+
+
+def _has_break(loop: ast.While) -> bool:
+    # A break in a nested loop does not exit this one
+    stack = list(loop.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Break):
+            return True
+        if isinstance(node, (ast.For, ast.While, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        stack.extend(ast.iter_child_nodes(node))
+    return False
+
+
+def _module_bindings(tree: ast.Module, name: str) -> list:
+    """
+    Module-level statements that bind `name`, including ones nested in
+    if/try/with/loop blocks (but not inside function or class bodies)
+    """
+    bindings = []
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name == name:
+                bindings.append(node)
+            continue
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if any((alias.asname or alias.name.split('.')[0]) == name for alias in node.names):
+                bindings.append(node)
+            continue
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Name) and t.id == name
+                   for target in targets for t in ast.walk(target)):
+                bindings.append(node)
+            continue
+        if isinstance(node, ast.stmt):
+            # Descend into compound statement blocks (if/try/with/for/while)
+            for field in ('body', 'orelse', 'finalbody', 'handlers'):
+                stack.extend(reversed(getattr(node, field, [])))
+        elif isinstance(node, ast.ExceptHandler):
+            stack.extend(reversed(node.body))
+    return bindings
+
+
+def prescreen_code(code: str, function_signature: str) -> Optional[Dict[str, Any]]:
+    """
+    Cheap in-process checks run before spawning a sandbox. Returns an
+    execute_code-shaped failure result, or None if the code should run.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return _reject('syntax', f'SyntaxError: {e.msg} (line {e.lineno})')
+    except (ValueError, MemoryError, RecursionError):
+        # Null bytes, or nesting too deep for the parser
+        return _reject('syntax', 'Code could not be parsed (too deeply nested or invalid)')
+
+    function_name, params = parse_signature(function_signature)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or '']
+        else:
+            continue
+        for module in modules:
+            if module.split('.')[0] in DISALLOWED_IMPORTS:
+                return _reject('import', f'Import of "{module}" is not allowed')
+
+    for node in tree.body:
+        if isinstance(node, ast.While) and _is_constant_true(node.test) and not _has_break(node):
+            return _reject('loop', f'Infinite top-level loop on line {node.lineno}')
+
+    bindings = _module_bindings(tree, function_name)
+    if not bindings:
+        return _reject('missing_function', f'Function {function_name}() is not defined')
+
+    # Arguments can only be checked statically for a single plain def
+    if len(bindings) == 1 and isinstance(bindings[0], ast.FunctionDef):
+        arity_error = _check_arguments(bindings[0], params)
+        if arity_error:
+            return _reject('arity', arity_error)
+
+    return None
@@ -0,0 +1,242 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional
+
+from prescreen import parse_signature, prescreen_code
+
+EXECUTION_TIMEOUT = 10  # seconds per submission
+POOL_SIZE = int(os.getenv('RUNNER_POOL_SIZE', 2))  # warm processes per language
+
+
+class WorkerPool:
+    """
+    Pre-started, single-use interpreter processes. Each worker blocks on
+    stdin until it is handed a script, runs it once and exits, so every
+    submission still gets a fresh process but the interpreter start-up is
+    paid ahead of time. After each run the pool is topped back up on a
+    background thread (a green thread under eventlet's monkey patching), so
+    the refill spawns never delay the submission's result.
+    """
+
+    def __init__(self, command: List[str], size: int = POOL_SIZE):
+        self.command = command
+        self.size = size
+        self.idle: Deque[subprocess.Popen] = deque()
+        self._refilling = False
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+    def acquire(self) -> subprocess.Popen:
+        # Workers are filled on first use rather than at server start
+        while self.idle:
+            process = self.idle.popleft()
+            if process.poll() is None:
+                break
+        else:
+            process = self._spawn()
+        return process
+
+    def replenish(self):
+        while len(self.idle) < self.size:
+            self.idle.append(self._spawn())
+
+    def replenish_async(self):
+        """Refill the pool without blocking the caller"""
+        if self._refilling or len(self.idle) >= self.size:
+            return
+        self._refilling = True
+        threading.Thread(target=self._refill, daemon=True).start()
+
+    def _refill(self):
+        try:
+            self.replenish()
+        finally:
+            self._refilling = False
+
+    def shutdown(self):
+        while self.idle:
+            self.idle.popleft().kill()
+
+
+class Runner:
+    """
+    One execution backend. Subclasses provide the worker command, the
+    per-language signature and test harness; `run` returns the shared result
+    schema: {'passed': bool, 'testResults': List[Dict], 'error': str | None}.
+    """
+
+    language = ''
+    command: List[str] = []
+    screens = False  # whether `prescreen` actually checks anything
+
+    def __init__(self):
+        self.pool = WorkerPool(self.command)
+
+    def signature(self, function_signature: str) -> str:
+        """This language's signature for a problem's (Python) functionSignature"""
+        raise NotImplementedError
+
+    def build_script(self, code: str, function_signature: str, test_cases: List[Dict]) -> str:
+        raise NotImplementedError
+
+    def prescreen(self, code: str, function_signature: str) -> Optional[Dict[str, Any]]:
+        """Cheap in-process rejection before a worker is used; None to run"""
+        return None
+
+    def run(self, code: str, function_signature: str, test_cases: List[Dict]) -> Dict[str, Any]:
+        script = self.build_script(code, function_signature, test_cases)
+        process = self.pool.acquire()
+        try:
+            stdout, stderr = process.communicate(input=script, timeout=EXECUTION_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return {
+                'passed': False,
+                'testResults': [],
+                'error': f'Code execution timed out ({EXECUTION_TIMEOUT} seconds max)'
+            }
+        finally:
+            self.pool.replenish_async()
+
+        if process.returncode != 0:
+            return {
+                'passed': False,
+                'testResults': [],
+                'error': stderr or 'Execution failed'
+            }
+
+        # Parse results
+        try:
+            test_results = json.loads(stdout.strip().split('\n')[-1])
+        except json.JSONDecodeError:
+            return {
+                'passed': False,
+                'testResults': [],
+                'error': 'Could not parse test results'
+            }
+        return {
+            'passed': all(t.get('passed', False) for t in test_results),
+            'testResults': test_results,
+            'error': None
+        }
+
+
+class PythonRunner(Runner):
+    language = 'python'
+    screens = True
+    # -I (isolated: ignore PYTHON* env vars and user site-packages) and -S
+    # (skip the site module); the script arrives on stdin
+    command = [sys.executable, '-I', '-S', '-c',
+               "import sys; exec(compile(sys.stdin.read(), '<submission>', 'exec'), {'__name__': '__main__'})"]
+
+    def signature(self, function_signature: str) -> str:
+        return function_signature
+
+    def prescreen(self, code: str, function_signature: str) -> Optional[Dict[str, Any]]:
+        return prescreen_code(code, function_signature)
+
+    def build_script(self, code: str, function_signature: str, test_cases: List[Dict]) -> str:
+        function_name, _ = parse_signature(function_signature)
+        script = f"""
+{code}
+
+# Test runner (private alias so a submission's own `json` name cannot break it)
+import json as _cb_json
+test_results = []
+"""
+        for i, test_case in enumerate(test_cases):
+            input_dict = test_case['input']
+            expected = test_case['expectedOutput']
+            args_str = ', '.join([f"{k}={repr(v)}" for k, v in input_dict.items()])
+
+            script += f"""
+try:
+    result_{i} = {function_name}({args_str})
+    expected_{i} = {repr(expected)}
+    passed_{i} = result_{i} == expected_{i}
+    test_results.append({{
+        'passed': passed_{i},
+        'input': {json.dumps(input_dict)},
+        'expected': expected_{i},
+        'actual': result_{i}
+    }})
+except Exception as e:
+    test_results.append({{
+        'passed': False,
+        'input': {json.dumps(input_dict)},
+        'expected': {repr(expected)},
+        'actual': None,
+        'error': str(e)
+    }})
+"""
+        script += """
+print(_cb_json.dumps(test_results))
+"""
+        return script
+
+
+class JavaScriptRunner(Runner):
+    language = 'javascript'
+    # Global (indirect) eval so top-level function declarations are visible
+    command = ['node', '-e',
+               "let s='';process.stdin.setEncoding('utf8');"
+               "process.stdin.on('data',d=>s+=d).on('end',()=>{(0,eval)(s)})"]
+
+    def signature(self, function_signature: str) -> str:
+        function_name, params = parse_signature(function_signature)
+        return f'function {function_name}({", ".join(params)}) {{'
+
+    def build_script(self, code: str, function_signature: str, test_cases: List[Dict]) -> str:
+        function_name, params = parse_signature(function_signature)
+        # Inputs are keyed by parameter name; JS functions take them positionally
+        return f"""
+{code}
+
+// Test runner (scoped so its names cannot clash with the submission; the
+// leading semicolon ends a last statement written without one)
+;(() => {{
+  const testCases = {json.dumps(test_cases)};
+  const params = {json.dumps(params)};
+  const testResults = testCases.map((testCase) => {{
+    try {{
+      const actual = {function_name}(...params.map((name) => testCase.input[name]));
+      return {{
+        passed: JSON.stringify(actual) === JSON.stringify(testCase.expectedOutput),
+        input: testCase.input,
+        expected: testCase.expectedOutput,
+        actual: actual === undefined ? null : actual
+      }};
+    }} catch (e) {{
+      return {{
+        passed: false,
+        input: testCase.input,
+        expected: testCase.expectedOutput,
+        actual: null,
+        error: String(e && e.message || e)
+      }};
+    }}
+  }});
+  console.log(JSON.stringify(testResults));
+}})();
+"""
+
+
+def available_runners() -> Dict[str, Runner]:
+    """Runners whose runtime is installed on this machine"""
+    runners: Dict[str, Runner] = {'python': PythonRunner()}
+    if shutil.which('node'):
+        runners['javascript'] = JavaScriptRunner()
+    return runners
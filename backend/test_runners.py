@@ -0,0 +1,45 @@
+"""
+Runner harness checks; run from backend/ with `python -m unittest test_runners`
+"""
+import shutil
+import unittest
+
+from runners import JavaScriptRunner, PythonRunner
+
+FUNCTION_SIGNATURE = 'def twoSum(nums: list, target: int) -> list:'
+TEST_CASES = [{'input': {'nums': [2, 7, 11, 15], 'target': 9}, 'expectedOutput': [0, 1]}]
+
+
+@unittest.skipUnless(shutil.which('node'), 'node is not installed')
+class JavaScriptRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.runner = JavaScriptRunner()
+        self.runner.pool.size = 0
+
+    def assertPasses(self, code: str):
+        result = self.runner.run(code, FUNCTION_SIGNATURE, TEST_CASES)
+        self.assertTrue(result['passed'], result['error'])
+
+    def test_function_declaration(self):
+        self.assertPasses('function twoSum(nums, target) {\n  return [0, 1];\n}\n')
+
+    def test_function_expression_without_semicolon(self):
+        self.assertPasses('const twoSum = function(nums, target){return [0,1]}')
+
+    def test_arrow_function_without_semicolon(self):
+        self.assertPasses('const twoSum = (nums, target) => [0,1]')
+
+
+class PythonRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.runner = PythonRunner()
+        self.runner.pool.size = 0
+
+    def test_submission_shadowing_json(self):
+        code = 'json = 5\ndef twoSum(nums, target):\n    return [0, 1]\n'
+        result = self.runner.run(code, FUNCTION_SIGNATURE, TEST_CASES)
+        self.assertTrue(result['passed'], result['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import { Profiler, ProfilerOnRenderCallback, useEffect, useRef, useState } from 'react'
+import { useGameStore, scheduleStoreUpdate, Player, ProblemCard } from '../store/gameStore'
+import { GameScreen } from '../components/GameScreen'
+
+// Render profiling harness: open /?bench=100 (or `npm run bench`) to render
+// GameScreen against N simulated opponents and a synthetic socket event stream
+
+const BENCH_DURATION_MS = 10_000
+const EVENT_INTERVAL_MS = 20
+
+interface BenchResult {
+  opponents: number
+  events: number
+  commits: number
+  avgCommitMs: number
+  frames: number
+  avgFrameMs: number
+  p95FrameMs: number
+  maxFrameMs: number
+}
+
+const makeCard = (i: number): ProblemCard => ({
+  id: `card-${i}`,
+  problem: {
+    title: `Bench Problem ${i}`,
+    description: 'Synthetic problem for render benchmarking.',
+    difficulty: 'Easy',
+    functionSignature: 'def solve(nums: list) -> int:',
+    testCases: []
+  },
+  reward: { type: 'buff', target: 'self', effect: 'add_time', value: 30 }
+})
+
+const makePlayer = (id: string, username: string, now: number): Player => ({
+  id,
+  username,
+  timerEndTime: now + 300_000,
+  isEliminated: false,
+  eliminatedAt: null,
+  currentProblem: null,
+  cards: Array.from({ length: 5 }, (_, i) => makeCard(i))
+})
+
+const seedStore = (opponents: number) => {
+  const now = Date.now()
+  const players: Record<string, Player> = { self: makePlayer('self', 'You', now) }
+  for (let i = 0; i < opponents; i++) {
+    players[`opponent-${i}`] = makePlayer(`opponent-${i}`, `Opponent ${i}`, now)
+  }
+  useGameStore.setState({
+    currentPlayerId: 'self',
+    username: 'You',
+    players,
+    gameStatus: 'playing',
+    selectedCardId: null
+  })
+}
+
+const percentile = (values: number[], p: number) => {
+  if (values.length === 0) return 0
+  const sorted = [...values].sort((a, b) => a - b)
+  return sorted[Math.min(sorted.length - 1, Math.floor((sorted.length - 1) * p))]
+}
+
+const round = (value: number) => Math.round(value * 100) / 100
+
+export function RenderBench({ opponents }: { opponents: number }) {
+  // Seed before the first render so GameScreen mounts with every opponent
+  useState(() => seedStore(opponents))
+  const [result, setResult] = useState<BenchResult | null>(null)
+  const statsRef = useRef({ commits: 0, commitMs: 0, events: 0 })
+
+  const onRender: ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+    const stats = statsRef.current
+    stats.commits += 1
+    stats.commitMs += actualDuration
+  }
+
+  useEffect(() => {
+    const stats = statsRef.current
+    const frameTimes: number[] = []
+    let lastFrame = performance.now()
+    let frame = requestAnimationFrame(function tick(now) {
+      frameTimes.push(now - lastFrame)
+      lastFrame = now
+      frame = requestAnimationFrame(tick)
+    })
+
+    // Mimic server traffic: reward_applied timer changes and card_selected
+    // updates for random opponents, routed through the batched store path
+    const { updatePlayer } = useGameStore.getState()
+    const events = setInterval(() => {
+      const id = `opponent-${Math.floor(Math.random() * opponents)}`
+      stats.events += 1
+      scheduleStoreUpdate(() => {
+        const player = useGameStore.getState().players[id]
+        if (!player) return
+        if (Math.random() < 0.5) {
+          updatePlayer(id, { timerEndTime: (player.timerEndTime ?? Date.now()) - 1000 })
+        } else {
+          updatePlayer(id, { currentProblem: `card-${Math.floor(Math.random() * 5)}` })
+        }
+      })
+    }, EVENT_INTERVAL_MS)
+
+    const stop = setTimeout(() => {
+      clearInterval(events)
+      cancelAnimationFrame(frame)
+      const benchResult: BenchResult = {
+        opponents,
+        events: stats.events,
+        commits: stats.commits,
+        avgCommitMs: round(stats.commits ? stats.commitMs / stats.commits : 0),
+        frames: frameTimes.length,
+        avgFrameMs: round(frameTimes.reduce((sum, t) => sum + t, 0) / Math.max(1, frameTimes.length)),
+        p95FrameMs: round(percentile(frameTimes, 0.95)),
+        maxFrameMs: round(Math.max(0, ...frameTimes))
+      }
+      console.table(benchResult)
+      Object.assign(window, { __benchResult: benchResult })
+      setResult(benchResult)
+    }, BENCH_DURATION_MS)
+
+    return () => {
+      clearInterval(events)
+      clearTimeout(stop)
+      cancelAnimationFrame(frame)
+    }
+  }, [opponents])
+
+  return (
+    <>
+      {result && (
+        <pre className="fixed top-2 right-2 z-[80] bg-black/80 text-green-400 text-xs p-3 rounded">
+          {JSON.stringify(result, null, 2)}
+        </pre>
+      )}
+      <Profiler id="GameScreen" onRender={onRender}>
+        <GameScreen
+          emitSelectCard={() => {}}
+          emitSubmitSolution={() => {}}
+          emitPlayerEliminated={() => {}}
+          socket={null}
+        />
+      </Profiler>
+    </>
+  )
+}
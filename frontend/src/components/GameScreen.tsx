@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
-import { useGameStore } from '../store/gameStore'
+import { useShallow } from 'zustand/react/shallow'
+import { useGameStore, selectCurrentPlayer, selectPlayerIds } from '../store/gameStore'
 import { PlayerHealthBar } from './PlayerHealthBar'
 import { ProblemCard } from './ProblemCard'
 import { CodeEditor } from './CodeEditor'
@@ -15,14 +16,15 @@ interface GameScreenProps {
 }
 
 export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerEliminated, socket }: GameScreenProps) {
-  const {
-    players,
-    currentPlayerId,
-    selectedCardId,
-    selectCard,
-    updatePlayer,
-    gameStatus
-  } = useGameStore()
+  // Narrow subscriptions: opponent updates re-render their own
+  // PlayerHealthBar, not this whole screen
+  const currentPlayerId = useGameStore((state) => state.currentPlayerId)
+  const currentPlayer = useGameStore(selectCurrentPlayer)
+  const playerIds = useGameStore(useShallow(selectPlayerIds))
+  const selectedCardId = useGameStore((state) => state.selectedCardId)
+  const gameStatus = useGameStore((state) => state.gameStatus)
+  const selectCard = useGameStore((state) => state.selectCard)
+  const updatePlayer = useGameStore((state) => state.updatePlayer)
 
   const [testFeedback, setTestFeedback] = useState<{
     type: 'success' | 'error' | null
@@ -54,14 +56,6 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
   // Debug menu state
   const [showDebugMenu, setShowDebugMenu] = useState(false)
 
-
-  // Ticker to force re-renders for timer display
-  const [, setTicker] = useState(0)
-
-  // Store final times when game ends
-  const [finalTimes, setFinalTimes] = useState<Record<string, number>>({})
-
-  const currentPlayer = currentPlayerId ? players[currentPlayerId] : null
   const selectedCard = currentPlayer?.cards.find(c => c.id === selectedCardId) || null
 
   // Trigger animation when cards are first loaded
@@ -78,8 +72,10 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
 
     const handleSolutionPassed = (data: any) => {
       if (data.playerId === currentPlayerId) {
-        // Find the card to get the reward info
-        const completedCard = currentPlayer?.cards.find(c => c.id === data.cardId)
+        // Find the card to get the reward info (store removal is applied on
+        // the next frame, so the card is still in hand here)
+        const player = useGameStore.getState().players[currentPlayerId]
+        const completedCard = player?.cards.find(c => c.id === data.cardId)
         const rewardText = completedCard?.reward
           ? `${completedCard.reward.effect.replace('_', ' ')} ${completedCard.reward.value}s`
           : 'No reward'
@@ -148,29 +144,28 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
       socket.off('target_selection_required', handleTargetSelectionRequired)
       socket.off('flashbang_applied', handleFlashbang)
     }
-  }, [socket, currentPlayerId, currentPlayer])
+  }, [socket, currentPlayerId])
 
-  // Timer check - runs every 100ms for smooth updates
+  // Elimination check - timer display is interpolated by each PlayerHealthBar,
+  // so this only watches for expiry and never re-renders the screen
+  const isEliminated = currentPlayer?.isEliminated ?? false
+  const timerEndTime = currentPlayer?.timerEndTime ?? null
   useEffect(() => {
     // Stop timer updates when game ends
     if (gameStatus === 'ended') return
-    if (!currentPlayer || currentPlayer.isEliminated || !currentPlayer.timerEndTime) return
+    if (!currentPlayerId || isEliminated || !timerEndTime) return
 
     const interval = setInterval(() => {
-      // Force re-render to update timer display
-      setTicker(prev => prev + 1)
-
-      const timeLeft = Math.max(0, Math.floor((currentPlayer.timerEndTime! - Date.now()) / 1000))
-
-      if (timeLeft === 0 && !currentPlayer.isEliminated) {
+      if (Date.now() >= timerEndTime) {
         // Timer expired - emit player eliminated
+        clearInterval(interval)
         emitPlayerEliminated()
-        updatePlayer(currentPlayerId!, { isEliminated: true, eliminatedAt: Date.now(), timerEndTime: null })
+        updatePlayer(currentPlayerId, { isEliminated: true, eliminatedAt: Date.now(), timerEndTime: null })
       }
-    }, 100) // Check every 100ms for smooth countdown
+    }, 100)
 
     return () => clearInterval(interval)
-  }, [currentPlayerId, currentPlayer, emitPlayerEliminated, updatePlayer, gameStatus])
+  }, [currentPlayerId, isEliminated, timerEndTime, emitPlayerEliminated, updatePlayer, gameStatus])
 
   const handleCardSelect = (cardId: string) => {
     if (currentPlayer && !currentPlayer.isEliminated) {
@@ -237,98 +232,9 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
   // When a card is selected, hide other cards
   const cardsToShow = selectedCardId ? currentPlayer.cards.filter(c => c.id === selectedCardId) : currentPlayer.cards
 
-  // Capture final times when game ends
-  useEffect(() => {
-    if (gameStatus === 'ended' && Object.keys(finalTimes).length === 0) {
-      const times: Record<string, number> = {}
-      Object.values(players).forEach(player => {
-        if (player.timerEndTime && !player.isEliminated) {
-          times[player.id] = Math.max(0, Math.floor((player.timerEndTime - Date.now()) / 1000))
-        } else {
-          times[player.id] = 0
-        }
-      })
-      setFinalTimes(times)
-    }
-  }, [gameStatus, players, finalTimes])
-
   // Show winner screen if game ended
   if (gameStatus === 'ended') {
-    // Rank players: non-eliminated first (by time remaining), then eliminated (by elimination order)
-    const rankedPlayers = Object.values(players).sort((a, b) => {
-      // Non-eliminated players always rank higher than eliminated players
-      if (!a.isEliminated && b.isEliminated) return -1
-      if (a.isEliminated && !b.isEliminated) return 1
-
-      // Both non-eliminated: sort by time remaining (more time = higher rank)
-      if (!a.isEliminated && !b.isEliminated) {
-        return (b.timerEndTime || 0) - (a.timerEndTime || 0)
-      }
-
-      // Both eliminated: sort by elimination time (eliminated later = higher rank)
-      // Player eliminated last should be 2nd place
-      return (b.eliminatedAt || 0) - (a.eliminatedAt || 0)
-    })
-
-    const currentPlayerRank = rankedPlayers.findIndex(p => p.id === currentPlayerId) + 1
-
-    return (
-      <div className="min-h-screen bg-gray-900 text-white flex items-center justify-center p-8">
-        <div className="max-w-2xl w-full">
-          <div className="text-center mb-8">
-            <h1 className="text-6xl font-bold mb-4">Game Over!</h1>
-            {currentPlayerRank === 1 && <p className="text-3xl text-yellow-400 mb-2">🎉 You Won! 🎉</p>}
-            <p className="text-xl text-gray-400">
-              You placed #{currentPlayerRank} out of {rankedPlayers.length}
-            </p>
-          </div>
-
-          <div className="bg-gray-800 rounded-xl p-6 shadow-2xl">
-            <h2 className="text-2xl font-bold mb-4 text-center">Final Rankings</h2>
-            <div className="space-y-3">
-              {rankedPlayers.map((player, index) => {
-                const isCurrentPlayer = player.id === currentPlayerId
-                // Use captured final time instead of calculating dynamically
-                const timeRemaining = finalTimes[player.id] || 0
-                const minutes = Math.floor(timeRemaining / 60)
-                const seconds = timeRemaining % 60
-
-                return (
-                  <div
-                    key={player.id}
-                    className={`flex items-center justify-between p-4 rounded-lg ${isCurrentPlayer ? 'bg-blue-600 border-2 border-blue-400' : 'bg-gray-700'
-                      }`}
-                  >
-                    <div className="flex items-center gap-4">
-                      <div className={`text-2xl font-bold w-8 ${index === 0 ? 'text-yellow-400' :
-                        index === 1 ? 'text-gray-300' :
-                          index === 2 ? 'text-orange-400' :
-                            'text-gray-500'
-                        }`}>
-                        {index === 0 ? '🥇' : index === 1 ? '🥈' : index === 2 ? '🥉' : `#${index + 1}`}
-                      </div>
-                      <div>
-                        <p className="font-semibold text-lg">{player.username}</p>
-                        {player.isEliminated && <p className="text-sm text-red-400">Eliminated</p>}
-                      </div>
-                    </div>
-                    <div className="text-right">
-                      {!player.isEliminated ? (
-                        <p className="text-xl font-mono text-green-400">
-                          {minutes}:{String(seconds).padStart(2, '0')}
-                        </p>
-                      ) : (
-                        <p className="text-gray-500">0:00</p>
-                      )}
-                    </div>
-                  </div>
-                )
-              })}
-            </div>
-          </div>
-        </div>
-      </div>
-    )
+    return <GameOverScreen currentPlayerId={currentPlayerId} />
   }
 
   return (
@@ -386,11 +292,11 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
       {/* Left Sidebar - Player Health Bars */}
       <div className="w-80 bg-gray-800 border-r border-gray-700 p-4 overflow-y-auto">
         <h2 className="text-xl font-semibold mb-4">Players</h2>
-        {Object.values(players).map((player) => (
+        {playerIds.map((playerId) => (
           <PlayerHealthBar
-            key={player.id}
-            player={player}
-            isCurrentPlayer={player.id === currentPlayerId}
+            key={playerId}
+            playerId={playerId}
+            isCurrentPlayer={playerId === currentPlayerId}
           />
         ))}
       </div>
@@ -502,3 +408,105 @@ export function GameScreen({ emitSelectCard, emitSubmitSolution, emitPlayerElimi
     </div>
   )
 }
+
+// Final standings. Split out so the in-game screen does not subscribe to the
+// full players map; times are captured once when the game ends.
+function GameOverScreen({ currentPlayerId }: { currentPlayerId: string | null }) {
+  const players = useGameStore((state) => state.players)
+  const leaveRoom = useGameStore((state) => state.leaveRoom)
+
+  const [finalTimes] = useState<Record<string, number>>(() => {
+    const times: Record<string, number> = {}
+    Object.values(players).forEach(player => {
+      if (player.timerEndTime && !player.isEliminated) {
+        times[player.id] = Math.max(0, Math.floor((player.timerEndTime - Date.now()) / 1000))
+      } else {
+        times[player.id] = 0
+      }
+    })
+    return times
+  })
+
+  // Rank players: non-eliminated first (by time remaining), then eliminated (by elimination order)
+  const rankedPlayers = Object.values(players).sort((a, b) => {
+    // Non-eliminated players always rank higher than eliminated players
+    if (!a.isEliminated && b.isEliminated) return -1
+    if (a.isEliminated && !b.isEliminated) return 1
+
+    // Both non-eliminated: sort by time remaining (more time = higher rank)
+    if (!a.isEliminated && !b.isEliminated) {
+      return (b.timerEndTime || 0) - (a.timerEndTime || 0)
+    }
+
+    // Both eliminated: sort by elimination time (eliminated later = higher rank)
+    // Player eliminated last should be 2nd place
+    return (b.eliminatedAt || 0) - (a.eliminatedAt || 0)
+  })
+
+  const currentPlayerRank = rankedPlayers.findIndex(p => p.id === currentPlayerId) + 1
+
+  return (
+    <div className="min-h-screen bg-gray-900 text-white flex items-center justify-center p-8">
+      <div className="max-w-2xl w-full">
+        <div className="text-center mb-8">
+          <h1 className="text-6xl font-bold mb-4">Game Over!</h1>
+          {currentPlayerRank === 1 && <p className="text-3xl text-yellow-400 mb-2">🎉 You Won! 🎉</p>}
+          <p className="text-xl text-gray-400">
+            You placed #{currentPlayerRank} out of {rankedPlayers.length}
+          </p>
+        </div>
+
+        <div className="bg-gray-800 rounded-xl p-6 shadow-2xl">
+          <h2 className="text-2xl font-bold mb-4 text-center">Final Rankings</h2>
+          <div className="space-y-3">
+            {rankedPlayers.map((player, index) => {
+              const isCurrentPlayer = player.id === currentPlayerId
+              // Use captured final time instead of calculating dynamically
+              const timeRemaining = finalTimes[player.id] || 0
+              const minutes = Math.floor(timeRemaining / 60)
+              const seconds = timeRemaining % 60
+
+              return (
+                <div
+                  key={player.id}
+                  className={`flex items-center justify-between p-4 rounded-lg ${isCurrentPlayer ? 'bg-blue-600 border-2 border-blue-400' : 'bg-gray-700'
+                    }`}
+                >
+                  <div className="flex items-center gap-4">
+                    <div className={`text-2xl font-bold w-8 ${index === 0 ? 'text-yellow-400' :
+                      index === 1 ? 'text-gray-300' :
+                        index === 2 ? 'text-orange-400' :
+                          'text-gray-500'
+                      }`}>
+                      {index === 0 ? '🥇' : index === 1 ? '🥈' : index === 2 ? '🥉' : `#${index + 1}`}
+                    </div>
+                    <div>
+                      <p className="font-semibold text-lg">{player.username}</p>
+                      {player.isEliminated && <p className="text-sm text-red-400">Eliminated</p>}
+                    </div>
+                  </div>
+                  <div className="text-right">
+                    {!player.isEliminated ? (
+                      <p className="text-xl font-mono text-green-400">
+                        {minutes}:{String(seconds).padStart(2, '0')}
+                      </p>
+                    ) : (
+                      <p className="text-gray-500">0:00</p>
+                    )}
+                  </div>
+                </div>
+              )
+            })}
+          </div>
+        </div>
+
+        <button
+          onClick={leaveRoom}
+          className="w-full mt-6 py-3 bg-blue-600 hover:bg-blue-700 rounded-lg font-semibold transition-colors"
+        >
+          Back to Menu
+        </button>
+      </div>
+    </div>
+  )
+}
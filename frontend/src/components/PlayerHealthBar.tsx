@@ -1,15 +1,21 @@
-import { Player } from '../store/gameStore'
+import { memo } from 'react'
+import { useGameStore } from '../store/gameStore'
+import { useCountdown } from '../hooks/useCountdown'
 
 interface PlayerHealthBarProps {
-  player: Player
+  playerId: string
   isCurrentPlayer: boolean
 }
 
-export function PlayerHealthBar({ player, isCurrentPlayer }: PlayerHealthBarProps) {
+// Memoized and subscribed to a single player, so an update to one opponent
+// re-renders only that row
+export const PlayerHealthBar = memo(function PlayerHealthBar({ playerId, isCurrentPlayer }: PlayerHealthBarProps) {
+  const player = useGameStore((state) => state.players[playerId])
   // Calculate time remaining from timestamp
-  const timeRemaining = player.timerEndTime
-    ? Math.max(0, Math.floor((player.timerEndTime - Date.now()) / 1000))
-    : 0
+  const timeRemaining = useCountdown(player?.timerEndTime ?? null)
+
+  if (!player) return null
+
   const percentage = (timeRemaining / 300) * 100
   const currentCard = player.cards.find(c => c.id === player.currentProblem)
 
@@ -50,4 +56,4 @@ export function PlayerHealthBar({ player, isCurrentPlayer }: PlayerHealthBarProp
       )}
     </div>
   )
-}
\ No newline at end of file
+})
@@ -3,12 +3,16 @@ import { useGameStore } from '../store/gameStore'
 
 interface StartMenuProps {
   emitJoinRoom: (username: string, roomCode: string) => void
+  emitEnqueueMatch: (username: string) => void
+  emitLeaveMatchQueue: () => void
   connected: boolean
+  socket: any // Socket instance for listening to events
 }
 
-export function StartMenu({ emitJoinRoom, connected }: StartMenuProps) {
+export function StartMenu({ emitJoinRoom, emitEnqueueMatch, emitLeaveMatchQueue, connected, socket }: StartMenuProps) {
   const [username, setUsername] = useState('')
   const [roomCode, setRoomCode] = useState('')
+  const [searching, setSearching] = useState(false)
   const { setUsername: setStoreUsername, joinRoom, gameStatus } = useGameStore()
 
   // Navigate to lobby when gameStatus changes to 'lobby'
@@ -18,6 +22,25 @@ export function StartMenu({ emitJoinRoom, connected }: StartMenuProps) {
     }
   }, [gameStatus])
 
+  // Stop showing the search once the server refuses or drops the request
+  useEffect(() => {
+    if (!socket) return
+
+    const stopSearching = () => setSearching(false)
+
+    socket.on('error', stopSearching)
+    socket.on('join_error', stopSearching)
+    socket.on('match_queue_left', stopSearching)
+    socket.on('disconnect', stopSearching)
+
+    return () => {
+      socket.off('error', stopSearching)
+      socket.off('join_error', stopSearching)
+      socket.off('match_queue_left', stopSearching)
+      socket.off('disconnect', stopSearching)
+    }
+  }, [socket])
+
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault()
     if (username.trim() && connected) {
@@ -29,6 +52,20 @@ export function StartMenu({ emitJoinRoom, connected }: StartMenuProps) {
     }
   }
 
+  const handleFindMatch = () => {
+    if (username.trim() && connected) {
+      setStoreUsername(username.trim())
+      // Server places us into a room and starts the game (match_found)
+      emitEnqueueMatch(username.trim())
+      setSearching(true)
+    }
+  }
+
+  const handleCancelSearch = () => {
+    emitLeaveMatchQueue()
+    setSearching(false)
+  }
+
   return (
     <div className="min-h-screen bg-gray-900 text-white flex items-center justify-center">
       <div className="max-w-md w-full p-8">
@@ -84,6 +121,25 @@ export function StartMenu({ emitJoinRoom, connected }: StartMenuProps) {
           >
             Join Game
           </button>
+
+          <button
+            type="button"
+            onClick={handleFindMatch}
+            disabled={!connected || !username.trim() || searching}
+            className="w-full py-3 bg-purple-600 hover:bg-purple-700 rounded-lg font-semibold transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {searching ? 'Searching for a match...' : 'Find Public Match'}
+          </button>
+
+          {searching && (
+            <button
+              type="button"
+              onClick={handleCancelSearch}
+              className="w-full py-3 bg-gray-600 hover:bg-gray-700 rounded-lg font-semibold transition-colors"
+            >
+              Cancel Search
+            </button>
+          )}
         </form>
       </div>
     </div>
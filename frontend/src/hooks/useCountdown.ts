@@ -0,0 +1,23 @@
+import { useEffect, useState } from 'react'
+
+const secondsUntil = (endTime: number | null) =>
+  endTime ? Math.max(0, Math.floor((endTime - Date.now()) / 1000)) : 0
+
+/**
+ * Seconds remaining until `endTime`, interpolated locally from the server's
+ * timerEndTime. The component only re-renders when the whole-second value
+ * changes, not on every tick.
+ */
+export const useCountdown = (endTime: number | null, intervalMs = 250) => {
+  const [seconds, setSeconds] = useState(() => secondsUntil(endTime))
+
+  useEffect(() => {
+    setSeconds(secondsUntil(endTime))
+    if (!endTime) return
+
+    const interval = setInterval(() => setSeconds(secondsUntil(endTime)), intervalMs)
+    return () => clearInterval(interval)
+  }, [endTime, intervalMs])
+
+  return seconds
+}
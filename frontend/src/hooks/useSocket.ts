@@ -1,6 +1,6 @@
 import { useEffect, useState, useCallback } from 'react'
 import { io, Socket } from 'socket.io-client'
-import { useGameStore, Player, ProblemCard } from '../store/gameStore'
+import { useGameStore, scheduleStoreUpdate, Player, ProblemCard } from '../store/gameStore'
 
 const SOCKET_URL = import.meta.env.VITE_SOCKET_URL || 'http://localhost:5000'
 
@@ -8,22 +8,29 @@ export const useSocket = () => {
   const [socket, setSocket] = useState<Socket | null>(null)
   const [connected, setConnected] = useState(false)
 
-  const {
-    setCurrentPlayerId,
-    setGameStatus,
-    addPlayer,
-    updatePlayer,
-    removeCard,
-    addCard,
-    selectCard,
-    syncGameState
-  } = useGameStore()
-
   useEffect(() => {
+    // Actions are stable; read them once rather than subscribing this hook
+    // (and App, which calls it) to every store change
+    const {
+      setCurrentPlayerId,
+      setGameStatus,
+      addPlayer,
+      updatePlayer,
+      removeCard,
+      addCard,
+      selectCard,
+      syncGameState
+    } = useGameStore.getState()
+
     const newSocket = io(SOCKET_URL, {
       transports: ['polling', 'websocket'], // Try polling first for ngrok stability
     })
 
+    // Register a handler whose store writes are batched into the next frame
+    const onBatched = <T>(event: string, handler: (data: T) => void) => {
+      newSocket.on(event, (data: T) => scheduleStoreUpdate(() => handler(data)))
+    }
+
     newSocket.on('connect', () => {
       console.log('Connected to server')
       setConnected(true)
@@ -35,7 +42,7 @@ export const useSocket = () => {
     })
 
     // Listen for player joined
-    newSocket.on('player_joined', (data: { playerId: string; username: string }) => {
+    onBatched('player_joined', (data: { playerId: string; username: string }) => {
       console.log('[Socket] player_joined event received:', data)
       // If this is the current player (we just joined), set currentPlayerId
       const username = useGameStore.getState().username
@@ -59,8 +66,22 @@ export const useSocket = () => {
       addPlayer(newPlayer)
     })
 
+    // Listen for matchmaking placing us into the room - this is our identity,
+    // so it does not rely on the username match in player_joined
+    onBatched('match_found', (data: { playerId: string; username: string; roomCode: string }) => {
+      const { setUsername, joinRoom } = useGameStore.getState()
+      setUsername(data.username)
+      joinRoom(data.roomCode)
+      setCurrentPlayerId(data.playerId)
+    })
+
+    // Listen for a finished room being cleared for the next matched group
+    onBatched('room_reset', () => {
+      useGameStore.getState().leaveRoom()
+    })
+
     // Listen for player left
-    newSocket.on('player_left', (data: { playerId: string; username: string }) => {
+    onBatched('player_left', (data: { playerId: string; username: string }) => {
       // Remove player from store
       const currentPlayers = useGameStore.getState().players
       const updatedPlayers = { ...currentPlayers }
@@ -69,14 +90,14 @@ export const useSocket = () => {
     })
 
     // Listen for game started
-    newSocket.on('game_started', (data: { players: Record<string, Player> }) => {
+    onBatched('game_started', (data: { players: Record<string, Player> }) => {
       setGameStatus('playing')
       // Update all players with their cards
       syncGameState({ players: data.players })
     })
 
     // Listen for card selected
-    newSocket.on('card_selected', (data: { playerId: string; cardId: string; problem: any }) => {
+    onBatched('card_selected', (data: { playerId: string; cardId: string; problem: any }) => {
       updatePlayer(data.playerId, { currentProblem: data.cardId })
       // If it's the current player, update selectedCardId
       if (data.playerId === useGameStore.getState().currentPlayerId) {
@@ -85,7 +106,7 @@ export const useSocket = () => {
     })
 
     // Listen for solution passed
-    newSocket.on('solution_passed', (data: {
+    onBatched('solution_passed', (data: {
       playerId: string
       cardId: string
       testResults: any[]
@@ -111,7 +132,7 @@ export const useSocket = () => {
     })
 
     // Listen for reward applied
-    newSocket.on('reward_applied', (data: {
+    onBatched('reward_applied', (data: {
       playerId?: string
       effect: string
       value: number
@@ -150,19 +171,19 @@ export const useSocket = () => {
     })
 
     // Listen for player eliminated
-    newSocket.on('player_eliminated', (data: { playerId: string; username: string; eliminatedAt: number }) => {
+    onBatched('player_eliminated', (data: { playerId: string; username: string; eliminatedAt: number }) => {
       updatePlayer(data.playerId, { isEliminated: true, eliminatedAt: data.eliminatedAt, timerEndTime: null })
     })
 
     // Listen for game ended
-    newSocket.on('game_ended', (data: { winner: string | null; winnerName?: string }) => {
+    onBatched('game_ended', (data: { winner: string | null; winnerName?: string }) => {
       setGameStatus('ended')
       // Could show winner screen here
       console.log('Game ended. Winner:', data.winnerName || 'None')
     })
 
     // Listen for game state updates
-    newSocket.on('game_state', (data: { players: Record<string, Player> }) => {
+    onBatched('game_state', (data: { players: Record<string, Player> }) => {
       console.log('[Socket] game_state event received:', data)
       syncGameState({ players: data.players })
     })
@@ -177,7 +198,7 @@ export const useSocket = () => {
     return () => {
       newSocket.close()
     }
-  }, [setCurrentPlayerId, setGameStatus, addPlayer, updatePlayer, removeCard, addCard, selectCard, syncGameState])
+  }, [])
 
   const emitJoinRoom = useCallback((username: string, roomCode: string) => {
     console.log('[Socket] emitJoinRoom called with:', { username, roomCode, connected: socket?.connected })
@@ -189,6 +210,18 @@ export const useSocket = () => {
     }
   }, [socket])
 
+  const emitEnqueueMatch = useCallback((username: string) => {
+    if (socket?.connected) {
+      socket.emit('enqueue_match', { username })
+    }
+  }, [socket])
+
+  const emitLeaveMatchQueue = useCallback(() => {
+    if (socket?.connected) {
+      socket.emit('leave_match_queue')
+    }
+  }, [socket])
+
   const emitStartGame = useCallback(() => {
     if (socket?.connected) {
       socket.emit('start_game')
@@ -223,6 +256,8 @@ export const useSocket = () => {
     socket,
     connected,
     emitJoinRoom,
+    emitEnqueueMatch,
+    emitLeaveMatchQueue,
     emitStartGame,
     emitSelectCard,
     emitSubmitSolution,
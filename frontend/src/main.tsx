@@ -3,8 +3,19 @@ import ReactDOM from 'react-dom/client'
 import App from './App.tsx'
 import './index.css'
 
-ReactDOM.createRoot(document.getElementById('root')!).render(
-  <React.StrictMode>
-    <App />
-  </React.StrictMode>,
-)
\ No newline at end of file
+const root = ReactDOM.createRoot(document.getElementById('root')!)
+
+// ?bench=<opponents> renders the profiling harness instead of the app
+const benchOpponents = new URLSearchParams(window.location.search).get('bench')
+
+if (benchOpponents !== null) {
+  import('./bench/RenderBench').then(({ RenderBench }) => {
+    root.render(<RenderBench opponents={Number(benchOpponents) || 100} />)
+  })
+} else {
+  root.render(
+    <React.StrictMode>
+      <App />
+    </React.StrictMode>,
+  )
+}
\ No newline at end of file
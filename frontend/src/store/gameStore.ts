@@ -12,6 +12,7 @@ export interface ProblemCard {
     description: string
     difficulty: 'Easy' | 'Medium' | 'Hard'
     functionSignature: string
+    signatures?: Record<string, string>  // Per-language signature, keyed by language
     testCases: TestCase[]
   }
   reward?: {
@@ -36,7 +37,7 @@ export interface Player {
   cards: ProblemCard[]
 }
 
-interface GameState {
+export interface GameState {
   // Current player info
   currentPlayerId: string | null
   username: string
@@ -52,6 +53,7 @@ interface GameState {
   // Actions
   setUsername: (username: string) => void
   joinRoom: (roomCode: string) => void
+  leaveRoom: () => void
   setGameStatus: (status: 'menu' | 'lobby' | 'playing' | 'ended') => void
   addPlayer: (player: Player) => void
   updatePlayer: (playerId: string, updates: Partial<Player>) => void
@@ -82,6 +84,16 @@ export const useGameStore = create<GameState>((set, get) => ({
     })
   },
 
+  leaveRoom: () => {
+    // Back to the start menu; the server has already released our socket
+    set({
+      players: {},
+      gameStatus: 'menu',
+      currentPlayerId: null,
+      selectedCardId: null
+    })
+  },
+
   setGameStatus: (status) => set({ gameStatus: status }),
 
   addPlayer: (player) => set((state) => ({
@@ -171,4 +183,45 @@ export const useGameStore = create<GameState>((set, get) => ({
   setCurrentPlayerId: (playerId: string) => {
     set({ currentPlayerId: playerId })
   }
-}))
\ No newline at end of file
+}))
+
+// Socket events are queued here and applied together on the next animation
+// frame, so a burst of events produces one store flush and one React commit.
+// requestAnimationFrame never fires in a background tab, so hidden tabs use
+// a timer instead and any queued updates flush when the tab is hidden.
+let pendingUpdates: Array<() => void> = []
+let pendingFrame: number | null = null
+let pendingTimer: ReturnType<typeof setTimeout> | null = null
+
+const HIDDEN_FLUSH_DELAY_MS = 50
+
+const flushUpdates = () => {
+  if (pendingFrame !== null) cancelAnimationFrame(pendingFrame)
+  if (pendingTimer !== null) clearTimeout(pendingTimer)
+  pendingFrame = null
+  pendingTimer = null
+  const updates = pendingUpdates
+  pendingUpdates = []
+  updates.forEach(update => update())
+}
+
+export const scheduleStoreUpdate = (update: () => void) => {
+  pendingUpdates.push(update)
+  if (pendingFrame !== null || pendingTimer !== null) return
+  if (document.hidden) {
+    pendingTimer = setTimeout(flushUpdates, HIDDEN_FLUSH_DELAY_MS)
+  } else {
+    pendingFrame = requestAnimationFrame(flushUpdates)
+  }
+}
+
+// A frame requested just before the tab was hidden would otherwise never run
+document.addEventListener('visibilitychange', () => {
+  if (document.hidden && pendingUpdates.length > 0) flushUpdates()
+})
+
+// Selectors - subscribe to the narrowest slice a component needs
+export const selectCurrentPlayer = (state: GameState) =>
+  state.currentPlayerId ? state.players[state.currentPlayerId] ?? null : null
+
+export const selectPlayerIds = (state: GameState) => Object.keys(state.players)